@@ -3,43 +3,84 @@
 Application factory.
 
 Creates and configures the Flask application using an environment-aware configuration.
+Blueprint modules (and their Redis/JSON dependencies) are imported lazily by the factory.
 """
 
 import os
+from collections.abc import Iterable
+from importlib import import_module
 
 from flask import Flask
 
 from .config import get_config
-from .extensions import init_extensions
-from .routes.core import bp as core_bp
-from .routes.policies import bp as policies_bp
-from .routes.shortener import bp as shortener_bp
 
 __all__ = ['create_app']
 
+# Default configuration name, read once at import
+_DEFAULT_ENV = os.getenv('ENV', 'development')
 
-def create_app(env: str | None = None) -> Flask:
+# Blueprint name -> module (relative to this package) exposing it as `bp`
+_BLUEPRINTS: dict[str, str] = {
+    'core': '.routes.core',
+    'policies': '.routes.policies',
+    'shortener': '.routes.shortener',
+}
+
+# Blueprints whose templates link to another blueprint's pages (via url_for)
+_BLUEPRINT_DEPS: dict[str, tuple[str, ...]] = {
+    'core': ('policies',),
+    'policies': ('core',),
+}
+
+
+def create_app(env: str | None = None, blueprints: Iterable[str] | None = None) -> Flask:
     """Create and configure the Flask application.
 
     Args:
         env: Explicit configuration name (e.g., 'development', 'production').
             If None, falls back to the ENV environment variable (default: 'development').
+        blueprints: Names of the blueprints to register (e.g., ['core']).
+            Blueprints they link to are added automatically ('core' and
+            'policies' need each other). If None, all blueprints are registered.
 
     Returns:
         A configured Flask application instance.
+
+    Raises:
+        ValueError: If `blueprints` is a plain string or names an unknown blueprint.
     """
+    if blueprints is None:
+        blueprints = list(_BLUEPRINTS)
+    elif isinstance(blueprints, str):
+        raise ValueError(f'blueprints must be a list of names, not a string: {blueprints!r}')
+    else:
+        blueprints = list(blueprints)
+        unknown = [name for name in blueprints if name not in _BLUEPRINTS]
+        if unknown:
+            raise ValueError(f'unknown blueprint(s) {unknown}; valid names are {list(_BLUEPRINTS)}')
+
+        # Add the blueprints they link to (transitively), registering each name once
+        pending, blueprints = blueprints, []
+        while pending:
+            name = pending.pop(0)
+            if name not in blueprints:
+                blueprints.append(name)
+                pending.extend(_BLUEPRINT_DEPS.get(name, ()))
+
     if env is None:
-        env = os.getenv('ENV', 'development')
+        env = _DEFAULT_ENV
 
     app = Flask(__name__, template_folder='templates')
     app.config.from_object(get_config(env))
 
     # Initialize extensions (DB, cache, login, etc.)
+    from .extensions import init_extensions
+
     init_extensions(app)
 
     # Register blueprints
-    app.register_blueprint(core_bp)
-    app.register_blueprint(policies_bp)
-    app.register_blueprint(shortener_bp)
+    for name in blueprints:
+        module = import_module(_BLUEPRINTS[name], __name__)
+        app.register_blueprint(module.bp)
 
     return app
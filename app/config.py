@@ -7,12 +7,14 @@ function to resolve the appropriate configuration dynamically.
 """
 
 import os
+from functools import lru_cache
 
 
 class BaseConfig:
     """Base configuration shared across all environments."""
 
     REDIS_URL: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    REDIS_MAX_CONNECTIONS: int = int(os.getenv('REDIS_MAX_CONNECTIONS', '16'))  # per worker
     SHORT_CODE_LEN: int = 8
     SHORT_TTL_SECONDS: int = 7 * 24 * 60 * 60  # 7 days
     SHORT_KEY_PREFIX: str = 'su:'
@@ -30,9 +32,12 @@ class ProdConfig(BaseConfig):
     DEBUG: bool = False
 
 
+@lru_cache(maxsize=4)
 def get_config(name: str | None = None) -> type[BaseConfig]:
     """Return a configuration class based on the provided or detected environment name.
 
+    Results are memoized per name; environment variables are read on the first call only.
+
     Args:
         name: Optional environment name (e.g., 'development', 'production').
               If not provided, detects from environment variables FLASK_ENV or ENV.
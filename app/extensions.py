@@ -2,14 +2,15 @@
 """
 Application extensions initializer.
 
-Manages shared services such as Redis. Provides both initialization at app startup
-and lazy loading fallback for safe access within request contexts.
+Manages shared services such as Redis. Clients are created once at app startup
+from a per-worker connection pool and looked up from the app registry afterwards.
 """
 
 import redis
 from flask import Flask, current_app
 
 _EXT_KEY = 'redis'  # Key for app.extensions registry
+_POOL_KEY = 'redis_pool'  # Connection pool backing the Redis client (for health checks)
 
 
 def init_extensions(app: Flask) -> None:
@@ -18,34 +19,38 @@ def init_extensions(app: Flask) -> None:
     Called once at app startup. Registers shared service clients
     (e.g., Redis) into the Flask app.extensions namespace.
     """
-    client = redis.Redis.from_url(app.config['REDIS_URL'], decode_responses=True)
+    # One blocking pool per worker process: callers wait for a free connection
+    # instead of opening new sockets when the pool is exhausted.
+    pool = redis.BlockingConnectionPool.from_url(
+        app.config['REDIS_URL'],
+        max_connections=app.config['REDIS_MAX_CONNECTIONS'],
+        decode_responses=True,
+        socket_keepalive=True,
+    )
+    client = redis.Redis(connection_pool=pool)
 
     # Ensure extensions dict exists
     if not hasattr(app, 'extensions') or app.extensions is None:
         app.extensions = {}
 
+    app.extensions[_POOL_KEY] = pool
     app.extensions[_EXT_KEY] = client
 
 
-def get_redis() -> redis.Redis:
-    """Return a Redis client from the current app context.
+def get_redis(app: Flask | None = None) -> redis.Redis:
+    """Return the Redis client of the given app, or of the current app context.
 
     Always use this accessor instead of directly creating Redis clients.
 
-    Behavior:
-        - Normal case: returns `app.extensions['redis']`
-        - Fallback: if not initialized, performs a lazy init based on current config
+    Raises:
+        RuntimeError: If `init_extensions` has not been called for the app.
     """
-    exts = getattr(current_app, 'extensions', {}) or {}
+    if app is None:
+        app = current_app
+    exts = getattr(app, 'extensions', {}) or {}
     client = exts.get(_EXT_KEY)
 
     if client is None:
-        # Lazy initialization (useful during early import or test contexts)
-        client = redis.Redis.from_url(current_app.config['REDIS_URL'], decode_responses=True)
-
-        if not hasattr(current_app, 'extensions') or current_app.extensions is None:
-            current_app.extensions = {}
-
-        current_app.extensions[_EXT_KEY] = client
+        raise RuntimeError('Redis is not initialized; call init_extensions(app) first')
 
     return client
@@ -7,32 +7,37 @@ Provides:
 - GET /terms   : Terms of Service page (multilingual)
 """
 
-import json
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
+import orjson
 from flask import Blueprint, abort, current_app, render_template, request
 
 bp = Blueprint('policies', __name__)
 
 # Supported languages (matches i18n system)
-SUPPORTED_LANGS = [
-    'en',
-    'ko',
-    'zh-CN',
-    'zh-TW',
-    'ja',
-    'fr',
-    'de',
-    'es',
-    'it',
-    'pl',
-    'pt',
-    'tr',
-    'ar',
-    'th',
-    'id',
-]
+SUPPORTED_LANGS = frozenset(
+    {
+        'en',
+        'ko',
+        'zh-CN',
+        'zh-TW',
+        'ja',
+        'fr',
+        'de',
+        'es',
+        'it',
+        'pl',
+        'pt',
+        'tr',
+        'ar',
+        'th',
+        'id',
+    }
+)
+
+# Languages with human-reviewed legal texts (others are machine translations)
+REVIEWED_LANGS = frozenset({'en', 'ko'})
 
 # Date format by language
 DATE_FORMATS = {
@@ -53,9 +58,44 @@ DATE_FORMATS = {
     'id': '%d %B %Y',
 }
 
+# Formatted 'last updated' dates keyed by (date, lang); only today's entries are kept.
+# Shared by all apps in the process, since it depends on nothing app-specific.
+_DATE_CACHE: dict[tuple[date, str], str] = {}
+
+_EXT_KEY = 'policies'  # Key for the per-app legal content in app.extensions
+
+
+def reload_legal_content(app):
+    """Load the legal JSON file of every supported language into the app.
+
+    Stores `{'content': {lang: data}, 'pages': {}}` in `app.extensions['policies']`,
+    where `pages` caches rendered HTML keyed by (page_type, lang, date). Both are
+    replaced together, so already rendered pages pick up the new content.
+
+    Args:
+        app: Flask app whose static folder holds the legal files
+    """
+    i18n_dir = Path(app.static_folder) / 'i18n'
+    content = {}
+    for lang in SUPPORTED_LANGS:
+        try:
+            content[lang] = orjson.loads((i18n_dir / f'legal_{lang}.json').read_bytes())
+        except FileNotFoundError:
+            continue  # Served in English instead
+        except (OSError, orjson.JSONDecodeError):
+            content[lang] = {}  # Unreadable or malformed: reported as unavailable content
+
+    app.extensions[_EXT_KEY] = {'content': content, 'pages': {}}
+
+
+@bp.record_once
+def _load_legal_files(state):
+    """Load the legal content once per app instead of on every request."""
+    reload_legal_content(state.app)
+
 
 def load_legal_content(lang, page_type):
-    """Load legal page content from JSON file.
+    """Look up preloaded legal page content.
 
     Args:
         lang: Language code (e.g., 'en', 'ko')
@@ -64,73 +104,83 @@ def load_legal_content(lang, page_type):
     Returns:
         dict: Legal page content, or None if not found
     """
-    # Validate language
-    if lang not in SUPPORTED_LANGS:
-        lang = 'en'  # Fallback to English
+    # Fall back to English for unsupported languages or missing files
+    legal_content = current_app.extensions[_EXT_KEY]['content']
+    data = legal_content.get(lang)
+    if data is None:
+        lang = 'en'
+        data = legal_content.get(lang)
+        if data is None:
+            return None, None, lang
 
-    # Build path to JSON file
-    static_dir = Path(current_app.static_folder)
-    json_path = static_dir / 'i18n' / f'legal_{lang}.json'
+    return data.get(page_type), data.get('footer'), lang
 
-    # If language file doesn't exist, fall back to English
-    if not json_path.exists():
-        json_path = static_dir / 'i18n' / 'legal_en.json'
-        lang = 'en'
 
-    try:
-        with open(json_path, encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get(page_type), data.get('footer'), lang
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None, None, lang
+def _prune_before(cache, today, date_index):
+    """Drop cache entries whose key holds a date other than `today`.
 
+    Iterates a snapshot of the keys, since other worker threads may insert concurrently.
 
-@bp.get('/privacy')
-def privacy():
-    """Render the Privacy Policy page with i18n support."""
-    lang = request.args.get('lang', 'en')
+    Args:
+        cache: Dict keyed by tuples that contain a date
+        today: Date of the entries to keep
+        date_index: Position of the date within each key
+    """
+    for key in list(cache):
+        if key[date_index] != today:
+            cache.pop(key, None)
 
-    content, footer, actual_lang = load_legal_content(lang, 'privacy')
 
-    if not content:
-        abort(500, 'Legal content not available')
+def format_legal_date(today, lang):
+    """Format a date for the legal pages, memoized per (date, language).
 
-    # Check if this is a machine translation
-    is_machine_translated = actual_lang not in ['en', 'ko']
+    Args:
+        today: Date to format
+        lang: Language code (e.g., 'en', 'ko')
 
-    # Format date according to language
-    date_format = DATE_FORMATS.get(actual_lang, '%B %d, %Y')
-    last_updated = datetime.now().strftime(date_format)
+    Returns:
+        str: Date formatted according to the language's convention
+    """
+    key = (today, lang)
+    formatted = _DATE_CACHE.get(key)
+    if formatted is None:
+        _prune_before(_DATE_CACHE, today, 0)
+        date_format = DATE_FORMATS.get(lang, '%B %d, %Y')
+        formatted = _DATE_CACHE.setdefault(key, today.strftime(date_format))
+    return formatted
 
-    return render_template(
-        'legal.html',
-        lang=actual_lang,
-        page_title=content['title'],
-        data=content,
-        footer=footer,
-        last_updated=last_updated,
-        is_machine_translated=is_machine_translated,
-    )
 
+def _render_legal_page(page_type):
+    """Render a legal page, reusing the cached HTML for the same language and day.
 
-@bp.get('/terms')
-def terms():
-    """Render the Terms of Service page with i18n support."""
+    Args:
+        page_type: 'privacy' or 'terms'
+
+    Returns:
+        str: Rendered HTML of the legal page
+    """
     lang = request.args.get('lang', 'en')
 
-    content, footer, actual_lang = load_legal_content(lang, 'terms')
+    content, footer, actual_lang = load_legal_content(lang, page_type)
 
     if not content:
         abort(500, 'Legal content not available')
 
+    # The page only varies by language and by the displayed date
+    pages = current_app.extensions[_EXT_KEY]['pages']
+    today = date.today()
+    cache_key = (page_type, actual_lang, today)
+    html = pages.get(cache_key)
+    if html is not None:
+        return html
+
     # Check if this is a machine translation
-    is_machine_translated = actual_lang not in ['en', 'ko']
+    is_machine_translated = actual_lang not in REVIEWED_LANGS
 
     # Format date according to language
-    date_format = DATE_FORMATS.get(actual_lang, '%B %d, %Y')
-    last_updated = datetime.now().strftime(date_format)
+    last_updated = format_legal_date(today, actual_lang)
 
-    return render_template(
+    html = render_template(
         'legal.html',
         lang=actual_lang,
         page_title=content['title'],
@@ -139,3 +189,20 @@ def terms():
         last_updated=last_updated,
         is_machine_translated=is_machine_translated,
     )
+
+    # Drop pages rendered on previous days before storing the fresh one
+    _prune_before(pages, today, 2)
+    pages[cache_key] = html
+    return html
+
+
+@bp.get('/privacy')
+def privacy():
+    """Render the Privacy Policy page with i18n support."""
+    return _render_legal_page('privacy')
+
+
+@bp.get('/terms')
+def terms():
+    """Render the Terms of Service page with i18n support."""
+    return _render_legal_page('terms')
@@ -7,75 +7,108 @@ Provides:
 - GET  /s/<code>    : redirect to the original (cached) path
 """
 
-from flask import Blueprint, abort, current_app, jsonify, redirect, request, url_for
+import orjson
+from flask import Blueprint, Response, abort, current_app, request, url_for
 
 from ..extensions import get_redis
-from ..utils.shortener import extract_path_preserving_query, new_code, same_origin
+from ..utils.shortener import new_code, parse_same_origin
 
 bp = Blueprint('shortener', __name__)
 
+_EXT_KEY = 'shortener'  # Key for the per-app settings and Redis handles in app.extensions
+
+# Reuse the code already mapped to a path, or claim a new one, in a single round trip.
+# KEYS: reverse key (path -> code), candidate forward key (code -> path)
+# ARGV: key prefix, path, TTL in seconds, candidate code
+# Returns {code, 1} when a new code was stored, {code, 0} when an existing one was
+# renewed, or nil when the candidate code collided with another mapping.
+# Limitation: the existing code's forward key (ARGV[1] .. existing) is only known
+# inside the script, so it is not declared in KEYS. This works on a standalone Redis
+# (as deployed), but fails under Redis Cluster or ACLs restricted by key pattern.
+_ALLOCATE_LUA = """
+local existing = redis.call('GET', KEYS[1])
+if existing and redis.call('EXPIRE', ARGV[1] .. existing, ARGV[3]) == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    return {existing, 0}
+end
+if redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3], 'NX') then
+    redis.call('SET', KEYS[1], ARGV[4], 'EX', ARGV[3])
+    return {ARGV[4], 1}
+end
+return false
+"""
+
+
+@bp.record_once
+def _load_settings(state):
+    """Read the shortener settings and Redis client once instead of on every request."""
+    client = get_redis(state.app)
+
+    # Kept per app, so several apps in one process (e.g., tests) do not share
+    # settings or send writes to each other's Redis
+    cfg = state.app.config
+    state.app.extensions[_EXT_KEY] = {
+        'redis': client,
+        # Sent by EVALSHA, falling back to EVAL the first time the server lacks it
+        'allocate': client.register_script(_ALLOCATE_LUA),
+        'ttl': cfg['SHORT_TTL_SECONDS'],
+        'prefix': cfg['SHORT_KEY_PREFIX'],
+        'code_len': cfg['SHORT_CODE_LEN'],
+    }
+
+
+def _ojsonify(obj: dict, status: int = 200) -> Response:
+    """Serialize `obj` with orjson into a JSON response (a lighter `jsonify`)."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
 
 @bp.post('/api/shorten')
 def api_shorten():
     """Create and persist a short code for a same-origin URL."""
-    r = get_redis()
+    settings = current_app.extensions[_EXT_KEY]
+    ttl, prefix = settings['ttl'], settings['prefix']
     data = request.get_json(silent=True) or {}
     raw = (data.get('url') or '').strip()
 
     if not raw:
-        return jsonify(error='url is required'), 400
-
-    if not same_origin(request, raw):
-        return jsonify(error='only same-origin URLs are allowed'), 400
+        return _ojsonify({'error': 'url is required'}, 400)
 
-    cfg = current_app.config
-    ttl = cfg['SHORT_TTL_SECONDS']
-    prefix = cfg['SHORT_KEY_PREFIX']
-    code_len = cfg['SHORT_CODE_LEN']
+    is_same_origin, path = parse_same_origin(request, raw)
+    if not is_same_origin:
+        return _ojsonify({'error': 'only same-origin URLs are allowed'}, 400)
 
-    path = extract_path_preserving_query(raw)
-
-    # Check if we already have a short code for this URL
     reverse_key = prefix + 'path:' + path
-    existing_code = r.get(reverse_key)
-
-    if existing_code:
-        # Verify the forward mapping still exists
-        forward_key = prefix + existing_code
-        if r.exists(forward_key):
-            # Renew TTL for both mappings
-            r.expire(forward_key, ttl)
-            r.expire(reverse_key, ttl)
-            short_path = url_for('shortener.redirect_short', code=existing_code)
-            return jsonify(code=existing_code, short_url=short_path, path=path), 200
 
     # Try multiple times to avoid key collisions under high contention
     for _ in range(8):
-        code = new_code(code_len)
-        key = prefix + code
-        ok = r.set(key, path, ex=ttl, nx=True)
-        if ok:
-            # Store reverse mapping (path -> code)
-            r.set(reverse_key, code, ex=ttl)
+        code = new_code(settings['code_len'])
+        result = settings['allocate'](
+            keys=[reverse_key, prefix + code],
+            args=[prefix, path, ttl, code],
+        )
+        if result:
+            code, created = result
             short_path = url_for('shortener.redirect_short', code=code)
-            return jsonify(code=code, short_url=short_path, path=path), 201
+            return _ojsonify(
+                {'code': code, 'short_url': short_path, 'path': path},
+                201 if created else 200,
+            )
 
-    return jsonify(error='could not allocate short code, try again'), 503
+    return _ojsonify({'error': 'could not allocate short code, try again'}, 503)
 
 
 @bp.get('/s/<code>')
 def redirect_short(code: str):
     """Resolve a short code and redirect to the original path."""
-    r = get_redis()
-    cfg = current_app.config
-    ttl = cfg['SHORT_TTL_SECONDS']
-    prefix = cfg['SHORT_KEY_PREFIX']
-
-    key = prefix + code
-    path = r.get(key)
+    settings = current_app.extensions[_EXT_KEY]
+    key = settings['prefix'] + code
+    # Fetch the path and touch its TTL atomically (extends the life of popular links)
+    path = settings['redis'].getex(key, ex=settings['ttl'])
     if not path:
         abort(404)
 
-    # Touch TTL to extend the life of popular links
-    r.expire(key, ttl)
-    return redirect(path, code=302)
+    # Bare 302 without redirect()'s HTML body; keep caches from skipping the TTL touch
+    return Response(
+        status=302,
+        headers={'Location': path, 'Cache-Control': 'private, max-age=0'},
+    )
@@ -2,16 +2,47 @@
 """
 URL shortener utility functions.
 
-Provides helper functions for generating short codes, validating URL origins,
-and preserving query strings during path extraction.
+Provides helper functions for generating short codes and for validating URL
+origins while extracting the path (query string preserved) in a single parse.
 """
 
-import secrets
-from urllib.parse import urlparse
+import os
+import re
+import threading
 
 from flask import Request
 
 _BASE62 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+_BASE62_BYTES = _BASE62.encode('ascii')
+
+# Random bytes at or above this value are rejected so `byte % 62` stays uniform
+_BASE62_BYTE_LIMIT = 256 - 256 % 62
+
+# `bytes.translate` table mapping each random byte to its Base62 character,
+# and the byte values deleted (rejected) during translation
+_BASE62_TABLE = bytes(_BASE62_BYTES[b % 62] for b in range(256))
+_BASE62_REJECTED = bytes(range(_BASE62_BYTE_LIMIT, 256))
+
+# Per-thread buffer of random bytes, refilled in bulk to amortize urandom syscalls
+_ENTROPY_POOL_SIZE = 4096
+_entropy = threading.local()
+
+
+def _reset_entropy() -> None:
+    """Discard buffered random bytes so a forked child never reuses its parent's."""
+    global _entropy
+    _entropy = threading.local()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_entropy)
+
+# Characters `urlparse` silently removes from URLs (WHATWG); they are never valid there
+# and would make the stored path unusable as a Location header
+_UNSAFE_URL_CHARS = str.maketrans('', '', '\t\r\n')
+
+# Absolute URL split into scheme, netloc, path and query (fragment ignored)
+_URL_RE = re.compile(r'([a-zA-Z][a-zA-Z0-9+\-.]*)://([^/?#]+)([^?#]*)(?:\?([^#]*))?')
 
 
 def to_base62(n: int) -> str:
@@ -19,22 +50,37 @@ def to_base62(n: int) -> str:
     if n == 0:
         return _BASE62[0]
 
-    digits: list[str] = []
+    # Collect ASCII digits least-significant first, then decode once
+    digits = bytearray()
     while n > 0:
         n, rem = divmod(n, 62)
-        digits.append(_BASE62[rem])
-    return ''.join(reversed(digits))
+        digits.append(_BASE62_BYTES[rem])
+    digits.reverse()
+    return digits.decode('ascii')
+
+
+def _random_bytes(n: int) -> bytearray:
+    """Take `n` random bytes from the calling thread's entropy buffer."""
+    pool = getattr(_entropy, 'pool', None)
+    if pool is None or len(pool) < n:
+        pool = _entropy.pool = bytearray(os.urandom(max(n, _ENTROPY_POOL_SIZE)))
+
+    # Consume from the end so the buffer is shrunk without moving its contents
+    chunk = pool[-n:]
+    del pool[-n:]
+    return chunk
 
 
 def new_code(code_len: int) -> str:
     """Generate a random Base62 short code of fixed length.
 
-    Uses 48 random bits, encoded in Base62, padded or truncated
-    to the requested length.
+    Maps one buffered random byte to each character, rejecting the few byte
+    values that would bias the distribution.
     """
-    code = to_base62(secrets.randbits(48))
-    code = _BASE62[0] * (code_len - len(code)) + code if len(code) < code_len else code[:code_len]
-    return code
+    code = bytearray()
+    while len(code) < code_len:
+        code += _random_bytes(code_len - len(code)).translate(_BASE62_TABLE, _BASE62_REJECTED)
+    return code.decode('ascii')
 
 
 def origin_of(req: Request) -> str:
@@ -42,25 +88,26 @@ def origin_of(req: Request) -> str:
     return f'{req.scheme}://{req.host}'
 
 
-def extract_path_preserving_query(target: str) -> str:
-    """Extract a relative path and preserve its query string from a URL."""
-    if target.startswith('/'):
-        return target
-
-    parsed = urlparse(target)
-    path = parsed.path or '/'
-    if parsed.query:
-        path += f'?{parsed.query}'
-    return path
+def parse_same_origin(req: Request, target: str) -> tuple[bool, str]:
+    """Check a URL against the request origin and extract its relative path.
 
+    Returns:
+        A tuple `(is_same_origin, path)` where `path` keeps the query string.
+        `path` is empty when the URL is not same-origin.
+    """
+    target = target.translate(_UNSAFE_URL_CHARS)
+    if target.startswith('/'):
+        return True, target
 
-def same_origin(req: Request, target_url: str) -> bool:
-    """Check if the target URL has the same origin as the given request."""
-    if target_url.startswith('/'):
-        return True
+    m = _URL_RE.match(target)
+    if m is None:
+        return False, ''
 
-    parsed = urlparse(target_url)
-    if not parsed.scheme or not parsed.netloc:
-        return False
+    scheme, netloc, path, query = m.groups()
+    if scheme.lower() + '://' + netloc != origin_of(req):
+        return False, ''
 
-    return f'{parsed.scheme}://{parsed.netloc}' == origin_of(req)
+    path = path or '/'
+    if query:
+        path += '?' + query
+    return True, path
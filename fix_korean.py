@@ -1,4 +1,5 @@
 import os
+import re
 
 # Define all replacements based on your grep output
 replacements = {
@@ -67,14 +68,14 @@ def fix_files():
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-            new_content = content
-            count = 0
-            for old_text, new_text in changes:
-                # Replace all occurrences
-                if old_text in new_content:
-                    occurrences = new_content.count(old_text)
-                    new_content = new_content.replace(old_text, new_text)
-                    count += occurrences
+            # Replace all patterns in a single scan (longest first, so overlapping
+            # patterns resolve to the most specific match)
+            changes_dict = dict(changes)
+            ordered = sorted(changes_dict, key=len, reverse=True)
+            pattern = re.compile('|'.join(re.escape(old_text) for old_text in ordered))
+            new_content, count = pattern.subn(
+                lambda m, table=changes_dict: table[m.group(0)], content
+            )
             
             if count > 0:
                 with open(file_path, 'w', encoding='utf-8') as f:
@@ -11,7 +11,12 @@ bind = '0.0.0.0:8000'
 workers = 4
 
 # Worker class
-worker_class = 'sync'
+# The app is IO-bound (Redis, templates), so threaded workers serve several
+# requests per process instead of blocking on one
+worker_class = 'gthread'
+
+# Threads per worker process (keep below REDIS_MAX_CONNECTIONS)
+threads = 8
 
 # Timeout in seconds
 timeout = 30